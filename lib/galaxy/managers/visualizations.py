@@ -13,13 +13,19 @@ from typing import (
 )
 
 from sqlalchemy import (
+    exists,
     false,
     func,
     or_,
     select,
     true,
 )
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import (
+    aliased,
+    joinedload,
+    lazyload,
+    selectinload,
+)
 
 from galaxy import (
     exceptions,
@@ -89,15 +95,28 @@ class VisualizationManager(sharable.SharableModelManager):
             raise exceptions.RequestParameterInvalidException(message)
 
         stmt = select(self.model_class)
+        # Load what to_dict() needs for every row up front instead of lazily per row,
+        # and skip the (eagerly mapped) latest revision and its config, which is not listed.
+        stmt = stmt.options(
+            joinedload(self.model_class.user),
+            selectinload(self.model_class.annotations),
+            selectinload(self.model_class.tags),
+            lazyload(self.model_class.latest_revision),
+        )
 
         filters = []
         if show_own or (not show_published and not show_shared and not is_admin):
             filters = [self.model_class.user == user]
         if show_published:
             filters.append(self.model_class.published == true())
+        # Most users have nothing shared with them, in which case the join
+        # against the share association table can be skipped entirely.
+        shared_with_me_filter = false()
         if user and show_shared:
-            filters.append(self.user_share_model.user == user)
-            stmt = stmt.outerjoin(self.model_class.users_shared_with)
+            if self._has_shared_with_user(trans.sa_session, user):
+                shared_with_me_filter = self.user_share_model.user == user
+                stmt = stmt.outerjoin(self.model_class.users_shared_with)
+            filters.append(shared_with_me_filter)
         stmt = stmt.where(or_(*filters))
 
         if payload.user_id:
@@ -137,7 +156,7 @@ class VisualizationManager(sharable.SharableModelManager):
                             if not show_shared:
                                 message = "Can only use tag is:shared_with_me if show_shared parameter also true."
                                 raise exceptions.RequestParameterInvalidException(message)
-                            stmt = stmt.where(self.user_share_model.user == user)
+                            stmt = stmt.where(shared_with_me_filter)
                 elif isinstance(term, RawTextTerm):
                     tf = p_tag_filter(term.text, False)
                     alias = aliased(model.User)
@@ -173,6 +192,10 @@ class VisualizationManager(sharable.SharableModelManager):
             stmt = stmt.offset(payload.offset)
         return trans.sa_session.scalars(stmt), total_matches  # type:ignore[return-value]
 
+    def _has_shared_with_user(self, session, user: model.User) -> bool:
+        stmt = select(exists().where(self.user_share_model.user == user))
+        return bool(session.scalar(stmt))
+
 
 class VisualizationSerializer(sharable.SharableModelSerializer):
     """
@@ -7577,7 +7577,10 @@ class StoredWorkflow(Base, HasTags, Dictifiable, RepresentById, UsesCreateAndUpd
     """
 
     __tablename__ = "stored_workflow"
-    __table_args__ = (Index("ix_stored_workflow_slug", "slug", mysql_length=200),)
+    __table_args__ = (
+        Index("ix_stored_workflow_slug", "slug", mysql_length=200),
+        Index("ix_stored_workflow_user_id_deleted_update_time", "user_id", "deleted", "update_time"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     create_time: Mapped[datetime] = mapped_column(default=now, nullable=True)
@@ -10402,6 +10405,7 @@ class Visualization(Base, HasTags, Dictifiable, RepresentById, UsesCreateAndUpda
     __table_args__ = (
         Index("ix_visualization_dbkey", "dbkey", mysql_length=200),
         Index("ix_visualization_slug", "slug", mysql_length=200),
+        Index("ix_visualization_slug_user_id", "slug", "user_id", mysql_length={"slug": 200}),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -11413,6 +11417,7 @@ HistoryDatasetAssociation.table = Table(
     Column(
         "hidden_beneath_collection_instance_id", ForeignKey("history_dataset_collection_association.id"), nullable=True
     ),
+    Index("ix_history_dataset_association_history_id_deleted", "history_id", "deleted"),
 )
 
 LibraryDatasetDatasetAssociation.table = Table(
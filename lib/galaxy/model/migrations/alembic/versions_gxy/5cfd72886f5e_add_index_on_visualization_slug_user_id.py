@@ -0,0 +1,32 @@
+"""Add composite index on visualization slug and user_id
+
+Revision ID: 5cfd72886f5e
+Revises: c63848676caf
+Create Date: 2024-06-20 10:12:31.518204
+
+"""
+
+from galaxy.model.database_object_names import build_index_name
+from galaxy.model.migrations.util import (
+    create_index,
+    drop_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "5cfd72886f5e"
+down_revision = "c63848676caf"
+branch_labels = None
+depends_on = None
+
+
+table_name = "visualization"
+columns = ["slug", "user_id"]
+index_name = build_index_name(table_name, columns)
+
+
+def upgrade():
+    create_index(index_name, table_name, columns, mysql_length={"slug": 200})
+
+
+def downgrade():
+    drop_index(index_name, table_name)
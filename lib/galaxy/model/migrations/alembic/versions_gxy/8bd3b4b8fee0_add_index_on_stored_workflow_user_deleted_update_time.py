@@ -0,0 +1,32 @@
+"""Add composite index on stored_workflow user_id, deleted and update_time
+
+Revision ID: 8bd3b4b8fee0
+Revises: aea4e4ca5c04
+Create Date: 2024-06-25 14:02:53.871126
+
+"""
+
+from galaxy.model.database_object_names import build_index_name
+from galaxy.model.migrations.util import (
+    create_index,
+    drop_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "8bd3b4b8fee0"
+down_revision = "aea4e4ca5c04"
+branch_labels = None
+depends_on = None
+
+
+table_name = "stored_workflow"
+columns = ["user_id", "deleted", "update_time"]
+index_name = build_index_name(table_name, columns)
+
+
+def upgrade():
+    create_index(index_name, table_name, columns)
+
+
+def downgrade():
+    drop_index(index_name, table_name)
@@ -0,0 +1,32 @@
+"""Add composite index on history_dataset_association history_id and deleted
+
+Revision ID: aea4e4ca5c04
+Revises: 5cfd72886f5e
+Create Date: 2024-06-24 09:41:17.204318
+
+"""
+
+from galaxy.model.database_object_names import build_index_name
+from galaxy.model.migrations.util import (
+    create_index,
+    drop_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "aea4e4ca5c04"
+down_revision = "5cfd72886f5e"
+branch_labels = None
+depends_on = None
+
+
+table_name = "history_dataset_association"
+columns = ["history_id", "deleted"]
+index_name = build_index_name(table_name, columns)
+
+
+def upgrade():
+    create_index(index_name, table_name, columns)
+
+
+def downgrade():
+    drop_index(index_name, table_name)
@@ -376,9 +376,9 @@ class NavigatesGalaxy(HasDriver):
             return response.json() if response.content else None
 
     def get_galaxy_session(self):
-        for cookie in self.driver.get_cookies():
-            if cookie["name"] == "galaxysession":
-                return cookie["value"]
+        cookie = self.driver.get_cookie("galaxysession")
+        if cookie:
+            return cookie["value"]
 
     def selenium_to_requests_cookies(self):
         return {"galaxysession": self.get_galaxy_session()}
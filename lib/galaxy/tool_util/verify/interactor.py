@@ -25,7 +25,10 @@ from typing import (
 )
 
 from packaging.version import Version
-from requests import Response
+from requests import (
+    Response,
+    Session,
+)
 from requests.cookies import RequestsCookieJar
 from typing_extensions import (
     Literal,
@@ -178,10 +181,13 @@ class GalaxyInteractorApi:
     api_key: Optional[str]
     cookies: Optional[RequestsCookieJar]
     keep_outputs_dir: Optional[str]
+    # optional requests session to issue API requests through (and reuse connections of)
+    session: Optional[Session]
 
     def __init__(self, **kwds):
         self.api_url = f"{kwds['galaxy_url'].rstrip('/')}/api"
         self.cookies = None
+        self.session = kwds.get("session")
         self.master_api_key = kwds["master_api_key"]
         self.api_key = self._get_user_key(
             kwds.get("api_key"), kwds.get("master_api_key"), test_user=kwds.get("test_user")
@@ -822,7 +828,8 @@ class GalaxyInteractorApi:
 
     def ensure_user_with_email(self, email, password=None):
         admin_key = self.master_api_key
-        all_users_response = self._get("users", key=admin_key)
+        # Narrow the listing server side, the filter is a substring match so still compare emails below.
+        all_users_response = self._get("users", data={"f_email": email}, key=admin_key)
         try:
             all_users_response.raise_for_status()
         except requests.exceptions.HTTPError as e:
@@ -830,9 +837,8 @@ class GalaxyInteractorApi:
                 f"Failed to verify user with email [{email}] exists - perhaps you're targetting the wrong Galaxy server or using an incorrect admin API key. HTTP error: {e}"
             )
         all_users = all_users_response.json()
-        try:
-            test_user = [user for user in all_users if user["email"] == email][0]
-        except IndexError:
+        test_user = next((user for user in all_users if user["email"] == email), None)
+        if test_user is None:
             username = re.sub(r"[^a-z-\d]", "--", email.lower())
             password = password or "testpass"
             # If remote user middleware is enabled - this endpoint consumes
@@ -935,42 +941,46 @@ class GalaxyInteractorApi:
         url = self.get_api_url(path)
         kwd = self._prepare_request_params(data=data, files=files, as_json=json, headers=headers)
         kwd["timeout"] = kwd.pop("timeout", util.DEFAULT_SOCKET_TIMEOUT)
-        return requests.post(url, **kwd)
+        return self._request("post", url, **kwd)
 
     def _delete(self, path, data=None, key=None, headers=None, admin=False, anon=False, json=False, params=None):
         headers = self.api_key_header(key=key, admin=admin, anon=anon, headers=headers)
         url = self.get_api_url(path)
         kwd = self._prepare_request_params(data=data, as_json=json, params=params, headers=headers)
         kwd["timeout"] = kwd.pop("timeout", util.DEFAULT_SOCKET_TIMEOUT)
-        return requests.delete(url, **kwd)
+        return self._request("delete", url, **kwd)
 
     def _patch(self, path, data=None, key=None, headers=None, admin=False, anon=False, json=False):
         headers = self.api_key_header(key=key, admin=admin, anon=anon, headers=headers)
         url = self.get_api_url(path)
         kwd = self._prepare_request_params(data=data, as_json=json, headers=headers)
         kwd["timeout"] = kwd.pop("timeout", util.DEFAULT_SOCKET_TIMEOUT)
-        return requests.patch(url, **kwd)
+        return self._request("patch", url, **kwd)
 
     def _put(self, path, data=None, key=None, headers=None, admin=False, anon=False, json=False):
         headers = self.api_key_header(key=key, admin=admin, anon=anon, headers=headers)
         url = self.get_api_url(path)
         kwd = self._prepare_request_params(data=data, as_json=json, headers=headers)
         kwd["timeout"] = kwd.pop("timeout", util.DEFAULT_SOCKET_TIMEOUT)
-        return requests.put(url, **kwd)
+        return self._request("put", url, **kwd)
 
-    def _get(self, path, data=None, key=None, headers=None, admin=False, anon=False, allow_redirects=True):
+    def _get(
+        self, path, data=None, key=None, headers=None, admin=False, anon=False, allow_redirects=True, stream=False
+    ):
         headers = self.api_key_header(key=key, admin=admin, anon=anon, headers=headers)
         url = self.get_api_url(path)
         kwargs: Dict[str, Any] = {}
         if self.cookies:
             kwargs["cookies"] = self.cookies
         # no data for GET
-        return requests.get(
+        return self._request(
+            "get",
             url,
             params=data,
             headers=headers,
             timeout=util.DEFAULT_SOCKET_TIMEOUT,
             allow_redirects=allow_redirects,
+            stream=stream,
             **kwargs,
         )
 
@@ -981,7 +991,20 @@ class GalaxyInteractorApi:
         if self.cookies:
             kwargs["cookies"] = self.cookies
         # no data for HEAD
-        return requests.head(url, params=data, headers=headers, timeout=util.DEFAULT_SOCKET_TIMEOUT, **kwargs)
+        return self._request(
+            "head",
+            url,
+            params=data,
+            headers=headers,
+            timeout=util.DEFAULT_SOCKET_TIMEOUT,
+            allow_redirects=False,
+            **kwargs,
+        )
+
+    def _request(self, method: str, url: str, **kwargs) -> Response:
+        if self.session is not None:
+            return self.session.request(method, url, **kwargs)
+        return getattr(requests, method)(url, **kwargs)
 
     def get_api_url(self, path: str) -> str:
         if path.startswith("http"):
@@ -1,5 +1,7 @@
 """ Data providers code for PhyloViz """
 
+import os
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -10,6 +12,23 @@ from galaxy.visualization.data_providers.phyloviz.newickparser import Newick_Par
 from galaxy.visualization.data_providers.phyloviz.nexusparser import Nexus_Parser
 from galaxy.visualization.data_providers.phyloviz.phyloxmlparser import Phyloxml_Parser
 
+PARSERS = {
+    "newick": Newick_Parser,
+    "nhx": Newick_Parser,
+    "phyloxml": Phyloxml_Parser,
+    "nex": Nexus_Parser,
+}
+
+
+@lru_cache(maxsize=8)
+def _parse_tree_file(file_ext, file_name, mtime):
+    """
+    Parse a tree file, caching the result for repeated views of the same
+    (unchanged) dataset file. `mtime` is only part of the cache key.
+    The result is shared between callers and must not be modified.
+    """
+    return PARSERS[file_ext]().parseFile(file_name)
+
 
 class PhylovizDataProvider(BaseDataProvider):
     dataset_type = "phylo"
@@ -29,17 +48,11 @@ class PhylovizDataProvider(BaseDataProvider):
         jsonDicts = []
         rval: Dict[str, Any] = {"dataset_type": self.dataset_type}
 
-        if file_ext in ["newick", "nhx"]:  # parses newick files
-            newickParser = Newick_Parser()
-            jsonDicts, parseMsg = newickParser.parseFile(file_name)
-        elif file_ext == "phyloxml":  # parses phyloXML files
-            phyloxmlParser = Phyloxml_Parser()
-            jsonDicts, parseMsg = phyloxmlParser.parseFile(file_name)
-        elif file_ext == "nex":  # parses nexus files
-            nexusParser = Nexus_Parser()
-            jsonDicts, parseMsg = nexusParser.parseFile(file_name)
-            jsonDicts = jsonDicts[int(tree_index)]
-            rval["trees"] = parseMsg
+        if file_ext in PARSERS:  # parses newick, phyloXML and nexus files
+            jsonDicts, parseMsg = _parse_tree_file(file_ext, file_name, os.path.getmtime(file_name))
+            if file_ext == "nex":
+                jsonDicts = jsonDicts[int(tree_index)]
+                rval["trees"] = parseMsg
 
         rval["data"] = jsonDicts
         rval["msg"] = parseMsg
@@ -9,6 +9,7 @@ from typing import (
     Optional,
 )
 
+from sqlalchemy import select
 from webob.exc import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -606,6 +607,20 @@ class UsesLibraryMixinItems(SharableItemSecurityMixin):
         return security_agent.get_permissions(ldda)
 
 
+def iter_track_dicts(drawable_dicts):
+    """Yield the track dictionaries from a (nested) list of drawable dictionaries."""
+    for drawable_dict in drawable_dicts:
+        if "track_type" in drawable_dict:
+            yield drawable_dict
+        else:
+            yield from iter_track_dicts(drawable_dict["drawables"])
+
+
+def _track_dataset_type(hda_ldda):
+    """Normalize a saved track's `hda_ldda` value, anything but "hda" is loaded as an LDDA."""
+    return "hda" if hda_ldda == "hda" else "ldda"
+
+
 class UsesVisualizationMixin(UsesLibraryMixinItems):
     """
     Mixin for controllers that use Visualization objects.
@@ -613,13 +628,16 @@ class UsesVisualizationMixin(UsesLibraryMixinItems):
 
     slug_builder = SlugBuilder()
 
-    def get_visualization(self, trans, id, check_ownership=True, check_accessible=False):
+    def get_visualization(self, trans, id, check_ownership=True, check_accessible=False, options=None):
         """
         Get a Visualization from the database by id, verifying ownership.
+
+        Optional loader `options` are passed through to the session so callers
+        can eagerly load the relationships they are about to traverse.
         """
         # Load workflow from database
         try:
-            visualization = trans.sa_session.get(model.Visualization, trans.security.decode_id(id))
+            visualization = trans.sa_session.get(model.Visualization, trans.security.decode_id(id), options=options)
         except TypeError:
             visualization = None
         if not visualization:
@@ -874,10 +892,8 @@ class UsesVisualizationMixin(UsesLibraryMixinItems):
             bookmarks = latest_revision.config.get("bookmarks", [])
 
             def pack_track(track_dict):
-                dataset_id = track_dict["dataset_id"]
                 hda_ldda = track_dict.get("hda_ldda", "hda")
-                dataset_id = trans.security.encode_id(dataset_id)
-                dataset = self.get_hda_or_ldda(trans, hda_ldda, dataset_id)
+                dataset = self._get_track_dataset(trans, prefetched_datasets, hda_ldda, track_dict["dataset_id"])
                 try:
                     prefs = track_dict["prefs"]
                 except KeyError:
@@ -920,6 +936,15 @@ class UsesVisualizationMixin(UsesLibraryMixinItems):
                     encoded_dbkey = f"{user.username}:{dbkey}"
                 return encoded_dbkey
 
+            # Load all datasets referenced by the config in one query per type
+            # rather than issuing one query per track.
+            track_dicts = []
+            if "tracks" in latest_revision.config:
+                track_dicts = latest_revision.config["tracks"]
+            elif "view" in latest_revision.config:
+                track_dicts = list(iter_track_dicts(latest_revision.config["view"]["drawables"]))
+            prefetched_datasets = self._prefetch_track_datasets(trans, track_dicts)
+
             # Set tracks.
             tracks = []
             if "tracks" in latest_revision.config:
@@ -951,6 +976,50 @@ class UsesVisualizationMixin(UsesLibraryMixinItems):
 
         return config
 
+    def _prefetch_track_datasets(self, trans, track_dicts):
+        """
+        Load the HDAs and LDDAs referenced by `track_dicts`, one query per type.
+
+        Returns a dict mapping `("hda" or "ldda", decoded id)` to the dataset. No
+        security checks are done here, see `_get_track_dataset`.
+        """
+        ids_by_type = {"hda": set(), "ldda": set()}
+        for track_dict in track_dicts:
+            ids_by_type[_track_dataset_type(track_dict.get("hda_ldda", "hda"))].add(track_dict["dataset_id"])
+        prefetched = {}
+        for dataset_type, model_class in (
+            ("hda", HistoryDatasetAssociation),
+            ("ldda", LibraryDatasetDatasetAssociation),
+        ):
+            if ids := ids_by_type[dataset_type]:
+                stmt = select(model_class).where(model_class.id.in_(ids))
+                for dataset in trans.sa_session.scalars(stmt):
+                    prefetched[(dataset_type, dataset.id)] = dataset
+        return prefetched
+
+    def _get_track_dataset(self, trans, prefetched_datasets, hda_ldda, dataset_id):
+        """
+        Returns the dataset of a saved track, preferring one loaded by `_prefetch_track_datasets`.
+
+        Prefetched datasets must pass the same access checks as `get_hda_or_ldda`, anything
+        else is loaded through `get_hda_or_ldda` so errors are reported as before.
+        """
+        dataset = prefetched_datasets.get((_track_dataset_type(hda_ldda), dataset_id))
+        if dataset is not None and self._track_dataset_accessible(trans, dataset):
+            return dataset
+        return self.get_hda_or_ldda(trans, hda_ldda, trans.security.encode_id(dataset_id))
+
+    def _track_dataset_accessible(self, trans, dataset):
+        current_user_roles = trans.get_current_user_roles()
+        security_agent = trans.app.security_agent
+        if isinstance(dataset, HistoryDatasetAssociation):
+            # Same checks as get_hda(check_accessible=True).
+            return dataset.state != trans.model.Dataset.states.UPLOAD and security_agent.can_access_dataset(
+                current_user_roles, dataset.dataset
+            )
+        # Same checks as get_library_dataset_dataset_association.
+        return trans.user_is_admin or security_agent.can_access_library_item(current_user_roles, dataset, trans.user)
+
     def get_new_track_config(self, trans, dataset):
         """
         Returns track configuration dict for a dataset.
@@ -1062,16 +1131,18 @@ class UsesVisualizationMixin(UsesLibraryMixinItems):
 
         # Get data sources.
         data_sources = dataset.get_datasources(trans)
-        query_dbkey = dataset.dbkey
-        if query_dbkey == "?":
-            query_dbkey = dbkey
-        chroms_info = self.app.genomes.chroms(trans, dbkey=query_dbkey)
 
         # If there are no messages (messages indicate data is not ready/available), get data.
         messages_list = [data_source_dict["message"] for data_source_dict in data_sources.values()]
         if message := self._get_highest_priority_msg(messages_list):
             rval = message
         else:
+            # Only look up chromosome information once the data is known to be available.
+            query_dbkey = dataset.dbkey
+            if query_dbkey == "?":
+                query_dbkey = dbkey
+            chroms_info = self.app.genomes.chroms(trans, dbkey=query_dbkey)
+
             # HACK: chromatin interactions tracks use data as source.
             source = "index"
             if isinstance(dataset.datatype, ChromatinInteractions):
@@ -68,6 +68,15 @@ from galaxy.web.framework.middleware.static import CacheableStaticURLParser as S
 log = logging.getLogger(__name__)
 
 
+def _template_module_name(module_directory, uri):
+    """
+    Place compiled templates in a per-version subdirectory of `module_directory`,
+    so modules compiled by another Galaxy release are never picked up (Mako
+    only recompiles if the template source is newer than the compiled module).
+    """
+    return os.path.join(module_directory, VERSION, os.path.normpath(uri.lstrip("/"))) + ".py"
+
+
 UCSC_SERVERS = (
     "hgw1.cse.ucsc.edu",
     "hgw2.cse.ucsc.edu",
@@ -191,9 +200,16 @@ class WebApplication(base.WebApplication):
             # Then look in root directory
             path = stack.enter_context(as_file(base_template_path))
             paths.append(path)
-            # Create TemplateLookup with a small cache
+            # Create TemplateLookup with a small cache. Compiled templates are
+            # kept in the collection, so outside of debug mode skip the
+            # per-request stat() of every template file.
+            module_directory = galaxy_app.config.template_cache_path
             return mako.lookup.TemplateLookup(
-                directories=paths, module_directory=galaxy_app.config.template_cache_path, collection_size=500
+                directories=paths,
+                module_directory=module_directory,
+                modulename_callable=lambda filename, uri: _template_module_name(module_directory, uri),
+                collection_size=500,
+                filesystem_checks=getattr(galaxy_app.config, "debug", True),
             )
 
     def handle_controller_exception(self, e, trans, method, **kwargs):
@@ -170,12 +170,11 @@ class FastAPIUsers:
 
         Please use `/api/users/current/recalculate_disk_usage` instead.
         """
-        user_id = getattr(trans.user, "id", None)
-        if not user_id:
+        user = trans.user
+        if user is None:
             raise exceptions.AuthenticationRequired("Only registered users can recalculate disk usage.")
-        else:
-            result = self.service.recalculate_disk_usage(trans, user_id)
-            return Response(status_code=status.HTTP_204_NO_CONTENT) if result is None else result
+        result = self.service.recalculate_disk_usage(trans, user.id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT) if result is None else result
 
     @router.put(
         "/api/users/{user_id}/recalculate_disk_usage",
@@ -1,11 +1,18 @@
+import json
 import logging
-from json import loads
 
+import orjson
 from markupsafe import escape
 from paste.httpexceptions import (
     HTTPBadRequest,
     HTTPNotFound,
 )
+from sqlalchemy import (
+    exists,
+    false,
+    select,
+)
+from sqlalchemy.orm import joinedload
 
 from galaxy import (
     model,
@@ -31,6 +38,18 @@ from ..api import depends
 
 log = logging.getLogger(__name__)
 
+# Relationships traversed by security checks and Visualization.copy(); the
+# latest revision is already eagerly loaded by the mapping.
+COPY_LOAD_OPTIONS = [joinedload(model.Visualization.user)]
+
+
+def _load_config(config_json):
+    try:
+        return orjson.loads(config_json)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN and Infinity, which json accepts and saved configs may contain
+        return json.loads(config_json)
+
 
 class VisualizationController(
     BaseUIController, SharableMixin, UsesVisualizationMixin, UsesAnnotations, UsesItemRatings
@@ -48,7 +67,9 @@ class VisualizationController(
     @web.expose
     @web.require_login()
     def copy(self, trans, id, **kwargs):
-        visualization = self.get_visualization(trans, id, check_ownership=False, check_accessible=True)
+        visualization = self.get_visualization(
+            trans, id, check_ownership=False, check_accessible=True, options=COPY_LOAD_OPTIONS
+        )
         user = trans.get_user()
         owner = visualization.user == user
         new_title = f"Copy of '{visualization.title}'"
@@ -80,7 +101,9 @@ class VisualizationController(
 
         # Do import.
         session = trans.sa_session
-        visualization = self.get_visualization(trans, id, check_ownership=False, check_accessible=True)
+        visualization = self.get_visualization(
+            trans, id, check_ownership=False, check_accessible=True, options=COPY_LOAD_OPTIONS
+        )
         if visualization.importable is False:
             return trans.show_error_message(
                 f"The owner of this visualization has disabled imports via this link.<br>You can {referer_message}",
@@ -116,11 +139,17 @@ class VisualizationController(
         """Display visualization based on a username and slug."""
 
         # Get visualization.
-        session = trans.sa_session
-        user = session.query(model.User).filter_by(username=username).first()
-        visualization = (
-            trans.sa_session.query(model.Visualization).filter_by(user=user, slug=slug, deleted=False).first()
+        stmt = (
+            select(model.Visualization)
+            .join(model.User, model.Visualization.user_id == model.User.id)
+            .where(
+                model.User.username == username,
+                model.Visualization.slug == slug,
+                model.Visualization.deleted == false(),
+            )
+            .limit(1)
         )
+        visualization = trans.sa_session.scalars(stmt).first()
         if visualization is None:
             raise web.httpexceptions.HTTPNotFound()
 
@@ -146,7 +175,7 @@ class VisualizationController(
         visualization is created. Returns JSON of visualization.
         """
         # Get visualization attributes from kwargs or from config.
-        vis_config = loads(vis_json)
+        vis_config = _load_config(vis_json)
         vis_type = type or vis_config["type"]
         vis_id = id or vis_config.get("id", None)
         vis_title = title or vis_config.get("title", None)
@@ -208,11 +237,14 @@ class VisualizationController(
                 return self.message_exception(
                     trans, "Visualization identifier can only contain lowercase letters, numbers, and dashes (-)."
                 )
-            elif (
-                v_slug != v.slug
-                and trans.sa_session.query(model.Visualization)
-                .filter_by(user=v.user, slug=v_slug, deleted=False)
-                .first()
+            elif v_slug != v.slug and trans.sa_session.scalar(
+                select(
+                    exists().where(
+                        model.Visualization.user == v.user,
+                        model.Visualization.slug == v_slug,
+                        model.Visualization.deleted == false(),
+                    )
+                )
             ):
                 return self.message_exception(trans, "Visualization id must be unique.")
             else:
@@ -308,7 +340,7 @@ class VisualizationController(
         if type is None or config is None:
             return HTTPBadRequest("A visualization type and config are required to save a visualization")
         if isinstance(config, str):
-            config = loads(config)
+            config = _load_config(config)
         title = title or DEFAULT_VISUALIZATION_NAME
 
         # TODO: allow saving to (updating) a specific revision - should be part of UsesVisualization
@@ -26,7 +26,10 @@ from galaxy.managers.users import (
     UserManager,
     UserSerializer,
 )
-from galaxy.model import User
+from galaxy.model import (
+    User,
+    YIELD_PER_ROWS,
+)
 from galaxy.queue_worker import send_local_control_task
 from galaxy.quota import QuotaAgent
 from galaxy.schema import APIKeyModel
@@ -117,8 +120,10 @@ class UsersService(ServiceBase):
         user = trans.user
         if trans.anonymous or (user and user.id != user_id and not trans.user_is_admin):
             raise glx_exceptions.InsufficientPermissionsException("Access denied.")
-        user = self.user_manager.by_id(user_id)
-        return user
+        if user and user.id == user_id:
+            # user is requesting themselves, no need to look them up again
+            return user
+        return self.user_manager.by_id(user_id)
 
     def _anon_user_api_value(self, trans: ProvidesHistoryContext):
         """Return data for an anonymous user, truncated to only usage and quota_percent"""
@@ -207,7 +212,15 @@ class UsersService(ServiceBase):
         f_any: Optional[str],
     ) -> List[MaybeLimitedUserModel]:
         rval: List[MaybeLimitedUserModel] = []
-        stmt = select(User)
+        # Only select the columns exposed by UserModel instead of hydrating full User objects.
+        stmt = select(
+            User.id,
+            User.email,
+            User.username,
+            User.deleted,
+            User.active,
+            User.last_password_change,
+        )
 
         if f_email and (trans.user_is_admin or trans.app.config.expose_user_email):
             stmt = stmt.filter(User.email.like(f"%{f_email}%"))
@@ -216,15 +229,16 @@ class UsersService(ServiceBase):
             stmt = stmt.filter(User.username.like(f"%{f_name}%"))
 
         if f_any:
+            any_pattern = f"%{f_any}%"
             if trans.user_is_admin:
-                stmt = stmt.filter(or_(User.email.like(f"%{f_any}%"), User.username.like(f"%{f_any}%")))
+                stmt = stmt.filter(or_(User.email.like(any_pattern), User.username.like(any_pattern)))
             else:
                 if trans.app.config.expose_user_email and trans.app.config.expose_user_name:
-                    stmt = stmt.filter(or_(User.email.like(f"%{f_any}%"), User.username.like(f"%{f_any}%")))
+                    stmt = stmt.filter(or_(User.email.like(any_pattern), User.username.like(any_pattern)))
                 elif trans.app.config.expose_user_email:
-                    stmt = stmt.filter(User.email.like(f"%{f_any}%"))
+                    stmt = stmt.filter(User.email.like(any_pattern))
                 elif trans.app.config.expose_user_name:
-                    stmt = stmt.filter(User.username.like(f"%{f_any}%"))
+                    stmt = stmt.filter(User.username.like(any_pattern))
 
         if deleted:
             # only admins can see deleted users
@@ -240,26 +254,35 @@ class UsersService(ServiceBase):
                 and not trans.app.config.expose_user_name
                 and not trans.app.config.expose_user_email
             ):
-                if trans.user:
-                    return [UserModel(**trans.user.to_dict())]
+                if user := trans.user:
+                    return [
+                        UserModel(
+                            id=user.id,
+                            email=user.email,
+                            username=user.username,
+                            deleted=user.deleted,
+                            active=user.active,
+                            last_password_change=user.last_password_change,
+                            model_class="User",
+                        )
+                    ]
                 else:
                     return []
             stmt = stmt.filter(User.deleted == false())
-        for user in trans.sa_session.scalars(stmt).all():
-            user_dict = user.to_dict()
-            # If NOT configured to expose_email, do not expose email UNLESS the user is self, or
-            # the user is an admin
-            if user is not trans.user and not trans.user_is_admin:
-                expose_keys = ["id"]
-                if trans.app.config.expose_user_name:
-                    expose_keys.append("username")
-                if trans.app.config.expose_user_email:
-                    expose_keys.append("email")
-                limited_user = {}
-                for key, value in user_dict.items():
-                    if key in expose_keys:
-                        limited_user[key] = value
-                rval.append(LimitedUserModel(**limited_user))
+        is_admin = trans.user_is_admin
+        current_user_id = trans.user and trans.user.id
+        # If NOT configured to expose_email, do not expose email UNLESS the user is self, or
+        # the user is an admin
+        expose_keys = ["id"]
+        if trans.app.config.expose_user_name:
+            expose_keys.append("username")
+        if trans.app.config.expose_user_email:
+            expose_keys.append("email")
+        stmt = stmt.execution_options(yield_per=YIELD_PER_ROWS)
+        for row in trans.sa_session.execute(stmt).mappings():
+            user_dict = dict(row)
+            if user_dict["id"] != current_user_id and not is_admin:
+                rval.append(LimitedUserModel(**{key: user_dict[key] for key in expose_keys}))
             else:
-                rval.append(UserModel(**user_dict))
+                rval.append(UserModel(model_class="User", **user_dict))
         return rval
@@ -1,8 +1,11 @@
 from urllib.parse import urljoin
 
-from requests import get
+from requests import (
+    get,
+    Session,
+)
+from requests.auth import HTTPBasicAuth
 
-from galaxy_test.base.api_util import baseauth_headers
 from galaxy_test.base.decorators import requires_new_user
 from galaxy_test.base.populators import skip_without_tool
 from ._framework import ApiTestCase
@@ -16,16 +19,17 @@ class TestAuthenticateApi(ApiTestCase):
     def test_auth(self):
         self._setup_user(TEST_USER_EMAIL, TEST_USER_PASSWORD)
         baseauth_url = self._api_url("authenticate/baseauth", use_key=False)
-        headers = baseauth_headers(TEST_USER_EMAIL, TEST_USER_PASSWORD)
-        auth_response = get(baseauth_url, headers=headers)
-        self._assert_status_code_is(auth_response, 200)
-        auth_dict = auth_response.json()
-        self._assert_has_keys(auth_dict, "api_key")
+        # Reuse one connection for both requests
+        with Session() as session:
+            auth_response = session.get(baseauth_url, auth=HTTPBasicAuth(TEST_USER_EMAIL, TEST_USER_PASSWORD))
+            self._assert_status_code_is(auth_response, 200)
+            auth_dict = auth_response.json()
+            self._assert_has_keys(auth_dict, "api_key")
 
-        # Verify key...
-        random_api_url = self._api_url("users", use_key=False)
-        random_api_response = get(random_api_url, params=dict(key=auth_dict["api_key"]))
-        self._assert_status_code_is(random_api_response, 200)
+            # Verify key...
+            random_api_url = self._api_url("users", use_key=False)
+            random_api_response = session.get(random_api_url, params=dict(key=auth_dict["api_key"]))
+            self._assert_status_code_is(random_api_response, 200)
 
     @skip_without_tool("test_data_source")
     def test_tool_runner_session_cookie_handling(self):
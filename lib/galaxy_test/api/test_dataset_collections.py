@@ -1,6 +1,12 @@
-import zipfile
-from io import BytesIO
-from typing import List
+from operator import itemgetter
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+import pytest
 
 from galaxy.util.unittest_utils import skip_if_github_down
 from galaxy_test.base.api_asserts import assert_object_id_error
@@ -11,15 +17,49 @@ from galaxy_test.base.populators import (
 )
 from ._framework import ApiTestCase
 
+# This set is subject to change, but it's unlikely we'll be removing converters
+EXPECTED_BED_CONVERTERS = frozenset(
+    [
+        "CONVERTER_bed_to_fli_0",
+        "CONVERTER_bed_gff_or_vcf_to_bigwig_0",
+        "CONVERTER_bed_to_gff_0",
+        "CONVERTER_interval_to_bgzip_0",
+        "tabular_to_csv",
+        "CONVERTER_interval_to_bed6_0",
+        "CONVERTER_interval_to_bedstrict_0",
+        "CONVERTER_interval_to_tabix_0",
+        "CONVERTER_interval_to_bed12_0",
+    ]
+)
+
 
 class TestDatasetCollectionsApi(ApiTestCase):
     dataset_populator: DatasetPopulator
+    _read_only_contents_pair: Optional[Tuple[Dict[str, Any], str]] = None
+    _read_only_contents_history: Optional[Tuple[DatasetPopulator, str]] = None
+    _bed_path: Optional[str] = None
 
     def setUp(self):
         super().setUp()
         self.dataset_populator = DatasetPopulator(self.galaxy_interactor)
         self.dataset_collection_populator = DatasetCollectionPopulator(self.galaxy_interactor)
 
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            cls._delete_read_only_contents_history()
+        finally:
+            super().tearDownClass()
+
+    @classmethod
+    def _delete_read_only_contents_history(cls):
+        read_only_contents_history = cls.__dict__.get("_read_only_contents_history")
+        cls._read_only_contents_pair = None
+        cls._read_only_contents_history = None
+        if read_only_contents_history is not None:
+            dataset_populator, history_id = read_only_contents_history
+            dataset_populator.delete_history(history_id)
+
     def test_create_pair_from_history(self):
         with self.dataset_populator.test_history(require_new=False) as history_id:
             payload = self.dataset_collection_populator.create_pair_payload(
@@ -99,40 +139,29 @@ class TestDatasetCollectionsApi(ApiTestCase):
             pair_1_element_1 = pair_elements[0]
             assert pair_1_element_1["element_index"] == 0
 
-    def test_list_download(self):
+    @pytest.mark.parametrize(
+        "create_method,expected_count",
+        [("create_list_in_history", 3), ("create_pair_in_history", 2)],
+    )
+    def test_flat_collection_download(self, create_method, expected_count):
         with self.dataset_populator.test_history(require_new=False) as history_id:
-            fetch_response = self.dataset_collection_populator.create_list_in_history(
+            fetch_response = getattr(self.dataset_collection_populator, create_method)(
                 history_id, direct_upload=True
             ).json()
             dataset_collection = self.dataset_collection_populator.wait_for_fetched_collection(fetch_response)
             returned_dce = dataset_collection["elements"]
-            assert len(returned_dce) == 3, dataset_collection
-            create_response = self._download_dataset_collection(history_id=history_id, hdca_id=dataset_collection["id"])
-            self._assert_status_code_is(create_response, 200)
-            archive = zipfile.ZipFile(BytesIO(create_response.content))
-            namelist = archive.namelist()
-            assert len(namelist) == 3, f"Expected 3 elements in [{namelist}]"
+            assert len(returned_dce) == expected_count, dataset_collection
+            with self._download_dataset_collection_archive(
+                history_id=history_id, hdca_id=dataset_collection["id"]
+            ) as archive:
+                infos = archive.infolist()
+            assert len(infos) == expected_count, f"Expected {expected_count} elements in [{infos}]"
             collection_name = dataset_collection["name"]
-            for element, zip_path in zip(returned_dce, namelist):
-                assert f"{collection_name}/{element['element_identifier']}.{element['object']['file_ext']}" == zip_path
-
-    def test_pair_download(self):
-        with self.dataset_populator.test_history(require_new=False) as history_id:
-            fetch_response = self.dataset_collection_populator.create_pair_in_history(
-                history_id, direct_upload=True
-            ).json()
-            dataset_collection = self.dataset_collection_populator.wait_for_fetched_collection(fetch_response)
-            returned_dce = dataset_collection["elements"]
-            assert len(returned_dce) == 2, dataset_collection
-            hdca_id = dataset_collection["id"]
-            create_response = self._download_dataset_collection(history_id=history_id, hdca_id=hdca_id)
-            self._assert_status_code_is(create_response, 200)
-            archive = zipfile.ZipFile(BytesIO(create_response.content))
-            namelist = archive.namelist()
-            assert len(namelist) == 2, f"Expected 2 elements in [{namelist}]"
-            collection_name = dataset_collection["name"]
-            for element, zip_path in zip(returned_dce, namelist):
-                assert f"{collection_name}/{element['element_identifier']}.{element['object']['file_ext']}" == zip_path
+            expected_paths = [
+                f"{collection_name}/{element['element_identifier']}.{element['object']['file_ext']}"
+                for element in returned_dce
+            ]
+            assert [info.filename for info in infos] == expected_paths
 
     def test_list_pair_download(self):
         with self.dataset_populator.test_history(require_new=False) as history_id:
@@ -142,45 +171,33 @@ class TestDatasetCollectionsApi(ApiTestCase):
             assert len(returned_dce) == 1, dataset_collection
             list_collection_name = dataset_collection["name"]
             pair = returned_dce[0]
-            create_response = self._download_dataset_collection(history_id=history_id, hdca_id=dataset_collection["id"])
-            self._assert_status_code_is(create_response, 200)
-            archive = zipfile.ZipFile(BytesIO(create_response.content))
-            namelist = archive.namelist()
-            assert len(namelist) == 2, f"Expected 2 elements in [{namelist}]"
+            with self._download_dataset_collection_archive(
+                history_id=history_id, hdca_id=dataset_collection["id"]
+            ) as archive:
+                infos = archive.infolist()
+            assert len(infos) == 2, f"Expected 2 elements in [{infos}]"
             pair_collection_name = pair["element_identifier"]
-            for element, zip_path in zip(pair["object"]["elements"], namelist):
-                assert (
-                    f"{list_collection_name}/{pair_collection_name}/{element['element_identifier']}.{element['object']['file_ext']}"
-                    == zip_path
-                )
-
-    def test_list_list_download(self):
-        with self.dataset_populator.test_history(require_new=False) as history_id:
-            dataset_collection = self.dataset_collection_populator.create_list_of_list_in_history(
-                history_id, wait=True
-            ).json()
-            returned_dce = dataset_collection["elements"]
-            assert len(returned_dce) == 1, dataset_collection
-            create_response = self._download_dataset_collection(history_id=history_id, hdca_id=dataset_collection["id"])
-            self._assert_status_code_is(create_response, 200)
-            archive = zipfile.ZipFile(BytesIO(create_response.content))
-            namelist = archive.namelist()
-            assert len(namelist) == 3, f"Expected 3 elements in [{namelist}]"
+            expected_paths = [
+                f"{list_collection_name}/{pair_collection_name}/{element['element_identifier']}.{element['object']['file_ext']}"
+                for element in pair["object"]["elements"]
+            ]
+            assert [info.filename for info in infos] == expected_paths
 
-    def test_list_list_list_download(self):
+    @pytest.mark.parametrize("collection_type", ["list:list", "list:list:list"])
+    def test_nested_list_download(self, collection_type):
         with self.dataset_populator.test_history(require_new=False) as history_id:
             dataset_collection = self.dataset_collection_populator.create_list_of_list_in_history(
                 history_id,
-                collection_type="list:list:list",
+                collection_type=collection_type,
                 wait=True,
             ).json()
             returned_dce = dataset_collection["elements"]
             assert len(returned_dce) == 1, dataset_collection
-            create_response = self._download_dataset_collection(history_id=history_id, hdca_id=dataset_collection["id"])
-            self._assert_status_code_is(create_response, 200)
-            archive = zipfile.ZipFile(BytesIO(create_response.content))
-            namelist = archive.namelist()
-            assert len(namelist) == 3, f"Expected 3 elements in [{namelist}]"
+            with self._download_dataset_collection_archive(
+                history_id=history_id, hdca_id=dataset_collection["id"]
+            ) as archive:
+                infos = archive.infolist()
+            assert len(infos) == 3, f"Expected 3 elements in [{infos}]"
 
     def test_download_non_english_characters(self):
         with self.dataset_populator.test_history() as history_id:
@@ -273,12 +290,13 @@ class TestDatasetCollectionsApi(ApiTestCase):
                     "tags": ["name:collection1"],
                 }
             ]
-            payload = {
-                "history_id": history_id,
-                "targets": targets,
-                "__files": {"files_0|file_data": open(self.test_data_resolver.get_filename("4.bed"))},
-            }
-            self.dataset_populator.fetch(payload)
+            with open(self._get_bed_path(), "rb") as fh:
+                payload = {
+                    "history_id": history_id,
+                    "targets": targets,
+                    "__files": {"files_0|file_data": fh},
+                }
+                self.dataset_populator.fetch(payload)
             hdca = self._assert_one_collection_created_in_history(history_id)
             assert hdca["name"] == "Test upload"
             hdca_tags = hdca["tags"]
@@ -303,12 +321,13 @@ class TestDatasetCollectionsApi(ApiTestCase):
                     "name": "Test upload",
                 }
             ]
-            payload = {
-                "history_id": history_id,
-                "targets": targets,
-                "__files": {"files_0|file_data": open(self.test_data_resolver.get_filename("4.bed"))},
-            }
-            self.dataset_populator.fetch(payload)
+            with open(self._get_bed_path(), "rb") as fh:
+                payload = {
+                    "history_id": history_id,
+                    "targets": targets,
+                    "__files": {"files_0|file_data": fh},
+                }
+                self.dataset_populator.fetch(payload)
             hdca = self._assert_one_collection_created_in_history(history_id)
             assert hdca["name"] == "Test upload"
             assert len(hdca["elements"]) == 1, hdca
@@ -418,10 +437,13 @@ class TestDatasetCollectionsApi(ApiTestCase):
     def _download_dataset_collection(self, history_id: str, hdca_id: str):
         return self._get(f"histories/{history_id}/contents/dataset_collections/{hdca_id}/download")
 
+    def _download_dataset_collection_archive(self, history_id: str, hdca_id: str):
+        return self._get_zip_archive(f"histories/{history_id}/contents/dataset_collections/{hdca_id}/download")
+
     @requires_new_user
-    def test_collection_contents_security(self, history_id):
+    def test_collection_contents_security(self):
         # request contents on an hdca that doesn't belong to user
-        hdca, contents_url = self._create_collection_contents_pair(history_id)
+        hdca, contents_url = self._get_read_only_collection_contents_pair()
         with self._different_user():
             contents_response = self._get(contents_url)
             self._assert_status_code_is(contents_response, 403)
@@ -438,9 +460,9 @@ class TestDatasetCollectionsApi(ApiTestCase):
             contents_response = self._get(contents_url)
             self._assert_status_code_is(contents_response, 200)
 
-    def test_collection_contents_invalid_collection(self, history_id):
+    def test_collection_contents_invalid_collection(self):
         # request an invalid collection from a valid hdca, should get 404
-        hdca, contents_url = self._create_collection_contents_pair(history_id)
+        hdca, contents_url = self._get_read_only_collection_contents_pair()
         response = self._get(contents_url)
         self._assert_status_code_is(response, 200)
         fake_collection_id = "5d7db0757a2eb7ef"
@@ -481,9 +503,9 @@ class TestDatasetCollectionsApi(ApiTestCase):
         assert len(drill_contents) == len(hdca["elements"][0]["object"]["elements"])
         self._compare_collection_contents_elements(drill_contents, hdca["elements"][0]["object"]["elements"])
 
-    def test_collection_contents_limit_offset(self, history_id):
+    def test_collection_contents_limit_offset(self):
         # check limit/offset params for collection contents endpoint
-        hdca, root_contents_url = self._create_collection_contents_pair(history_id)
+        hdca, root_contents_url = self._get_read_only_collection_contents_pair()
 
         # check limit
         limited_contents = self._get(f"{root_contents_url}?limit=1").json()
@@ -506,82 +528,18 @@ class TestDatasetCollectionsApi(ApiTestCase):
         response.raise_for_status()
         assert response.json() == []
 
-    def test_get_suitable_converters_single_datatype(self, history_id):
-        response = self.dataset_collection_populator.upload_collection(
-            history_id,
-            "list:paired",
-            elements=[
-                {
-                    "name": "test0",
-                    "elements": [
-                        {"src": "pasted", "paste_content": "123\n", "name": "forward", "ext": "bed"},
-                        {"src": "pasted", "paste_content": "456\n", "name": "reverse", "ext": "bed"},
-                    ],
-                },
-                {
-                    "name": "test1",
-                    "elements": [
-                        {"src": "pasted", "paste_content": "789\n", "name": "forward", "ext": "bed"},
-                        {"src": "pasted", "paste_content": "0ab\n", "name": "reverse", "ext": "bed"},
-                    ],
-                },
-            ],
-            wait=True,
-        )
-        self._assert_status_code_is(response, 200)
-        hdca_list_id = response.json()["outputs"][0]["id"]
-        converters = self._get("dataset_collections/" + hdca_list_id + "/suitable_converters")
-        expected = [  # This list is subject to change, but it's unlikely we'll be removing converters
-            "CONVERTER_bed_to_fli_0",
-            "CONVERTER_bed_gff_or_vcf_to_bigwig_0",
-            "CONVERTER_bed_to_gff_0",
-            "CONVERTER_interval_to_bgzip_0",
-            "tabular_to_csv",
-            "CONVERTER_interval_to_bed6_0",
-            "CONVERTER_interval_to_bedstrict_0",
-            "CONVERTER_interval_to_tabix_0",
-            "CONVERTER_interval_to_bed12_0",
-        ]
-        actual = []
-        for converter in converters.json():
-            actual.append(converter["tool_id"])
-        missing_expected_converters = set(expected) - set(actual)
-        assert (
-            not missing_expected_converters
-        ), f"Expected converter(s) {', '.join(missing_expected_converters)} missing from response"
-
-    def test_get_suitable_converters_different_datatypes_matches(self, history_id):
-        response = self.dataset_collection_populator.upload_collection(
-            history_id,
-            "list:paired",
-            elements=[
-                {
-                    "name": "test0",
-                    "elements": [
-                        {"src": "pasted", "paste_content": "123\n", "name": "forward", "ext": "bed"},
-                        {"src": "pasted", "paste_content": "456\n", "name": "reverse", "ext": "bed"},
-                    ],
-                },
-                {
-                    "name": "test1",
-                    "elements": [
-                        {"src": "pasted", "paste_content": "789\n", "name": "forward", "ext": "tabular"},
-                        {"src": "pasted", "paste_content": "0ab\n", "name": "reverse", "ext": "tabular"},
-                    ],
-                },
-            ],
-            wait=True,
-        )
-        self._assert_status_code_is(response, 200)
-        hdca_list_id = response.json()["outputs"][0]["id"]
-        converters = self._get("dataset_collections/" + hdca_list_id + "/suitable_converters")
-        expected = "tabular_to_csv"
-        actual = []
-        for converter in converters.json():
-            actual.append(converter["tool_id"])
-        assert expected in actual
-
-    def test_get_suitable_converters_different_datatypes_no_matches(self, history_id):
+    @pytest.mark.parametrize(
+        "second_ext,expected_converters",
+        [
+            # single datatype
+            ("bed", EXPECTED_BED_CONVERTERS),
+            # different datatypes, matching converters
+            ("tabular", frozenset(["tabular_to_csv"])),
+            # different datatypes, no matching converters
+            ("fasta", frozenset()),
+        ],
+    )
+    def test_get_suitable_converters(self, history_id, second_ext, expected_converters):
         response = self.dataset_collection_populator.upload_collection(
             history_id,
             "list:paired",
@@ -596,8 +554,8 @@ class TestDatasetCollectionsApi(ApiTestCase):
                 {
                     "name": "test1",
                     "elements": [
-                        {"src": "pasted", "paste_content": "789\n", "name": "forward", "ext": "fasta"},
-                        {"src": "pasted", "paste_content": "0ab\n", "name": "reverse", "ext": "fasta"},
+                        {"src": "pasted", "paste_content": "789\n", "name": "forward", "ext": second_ext},
+                        {"src": "pasted", "paste_content": "0ab\n", "name": "reverse", "ext": second_ext},
                     ],
                 },
             ],
@@ -606,10 +564,14 @@ class TestDatasetCollectionsApi(ApiTestCase):
         self._assert_status_code_is(response, 200)
         hdca_list_id = response.json()["outputs"][0]["id"]
         converters = self._get("dataset_collections/" + hdca_list_id + "/suitable_converters")
-        actual: List[str] = []
-        for converter in converters.json():
-            actual.append(converter["tool_id"])
-        assert actual == []
+        actual = {converter["tool_id"] for converter in converters.json()}
+        if expected_converters:
+            missing_expected_converters = expected_converters - actual
+            assert (
+                not missing_expected_converters
+            ), f"Expected converter(s) {', '.join(missing_expected_converters)} missing from response"
+        else:
+            assert not actual, actual
 
     def test_collection_tools_tag_propagation(self, history_id):
         elements = [{"src": "files", "tags": ["name:element_tag"]}]
@@ -622,12 +584,13 @@ class TestDatasetCollectionsApi(ApiTestCase):
                 "tags": ["name:collection_tag"],
             }
         ]
-        payload = {
-            "history_id": history_id,
-            "targets": targets,
-            "__files": {"files_0|file_data": open(self.test_data_resolver.get_filename("4.bed"))},
-        }
-        hdca_id = self.dataset_populator.fetch(payload).json()["output_collections"][0]["id"]
+        with open(self._get_bed_path(), "rb") as fh:
+            payload = {
+                "history_id": history_id,
+                "targets": targets,
+                "__files": {"files_0|file_data": fh},
+            }
+            hdca_id = self.dataset_populator.fetch(payload).json()["output_collections"][0]["id"]
         inputs = {
             "input": {"batch": False, "src": "hdca", "id": hdca_id},
         }
@@ -648,10 +611,9 @@ class TestDatasetCollectionsApi(ApiTestCase):
 
     def _compare_collection_contents_elements(self, contents_elements, hdca_elements):
         # compare collection api results to existing hdca element contents
-        fields = ["element_identifier", "element_index", "element_type", "id", "model_class"]
+        get_fields = itemgetter("element_identifier", "element_index", "element_type", "id", "model_class")
         for content_element, hdca_element in zip(contents_elements, hdca_elements):
-            for f in fields:
-                assert content_element[f] == hdca_element[f]
+            assert get_fields(content_element) == get_fields(hdca_element)
 
     def _create_collection_contents_pair(self, history_id: str):
         # Create a simple collection, return hdca and contents_url
@@ -661,18 +623,31 @@ class TestDatasetCollectionsApi(ApiTestCase):
         root_contents_url = self._get_contents_url_for_hdca(history_id, hdca)
         return hdca, root_contents_url
 
-    def _get_contents_url_for_hdca(self, history_id: str, hdca):
-        # look up the history contents using optional serialization key
-        history_contents_url = f"histories/{history_id}/contents?v=dev&view=summary&keys=contents_url"
-        json = self._get(history_contents_url).json()
-
-        # filter out the collection we just made id = hdca.id
-        # make sure the contents_url appears
-        def find_hdca(c):
-            return c["history_content_type"] == "dataset_collection" and c["id"] == hdca["id"]
+    def _get_bed_path(self) -> str:
+        # Resolve the shared 4.bed upload once per test class
+        cls = type(self)
+        if cls._bed_path is None:
+            cls._bed_path = self.test_data_resolver.get_filename("4.bed")
+        return cls._bed_path
+
+    def _get_read_only_collection_contents_pair(self) -> Tuple[Dict[str, Any], str]:
+        # Tests that only read the pair's contents share a single collection
+        # per test class instead of creating and polling one each. The history
+        # is owned by the class and deleted in tearDownClass.
+        cls = type(self)
+        read_only_contents_pair = cls.__dict__.get("_read_only_contents_pair")
+        if read_only_contents_pair is None:
+            history_id = self.dataset_populator.new_history()
+            cls._read_only_contents_history = (self.dataset_populator, history_id)
+            read_only_contents_pair = self._create_collection_contents_pair(history_id)
+            cls._read_only_contents_pair = read_only_contents_pair
+        return read_only_contents_pair
 
-        matches = list(filter(find_hdca, json))
-        assert len(matches) == 1
-        assert "contents_url" in matches[0]
-
-        return matches[0]["contents_url"]
+    def _get_contents_url_for_hdca(self, history_id: str, hdca):
+        # look up the collection directly using optional serialization key
+        hdca_url = f"histories/{history_id}/contents/dataset_collections/{hdca['id']}?view=summary&keys=contents_url"
+        response = self._get(hdca_url)
+        self._assert_status_code_is(response, 200)
+        contents_url = response.json().get("contents_url")
+        assert contents_url, response.json()
+        return contents_url
@@ -1,10 +1,9 @@
 import textwrap
 import urllib
-import zipfile
-from io import BytesIO
 from typing import (
     Dict,
     List,
+    Tuple,
 )
 
 from galaxy.model.unittest_utils.store_fixtures import (
@@ -111,6 +110,18 @@ class TestDatasetsApi(ApiTestCase):
             assert index_response[2]["id"] == hda_id
             assert index_response[1]["history_content_type"] == "dataset_collection"
             assert index_response[1]["id"] == hdca_id
+            # keyset pagination: continue after the last seen hid instead of using an offset
+            keyset_payload = {
+                "limit": 2,
+                "order": "hid",
+                "history_id": history_id,
+                "q": ["hid-lt"],
+                "qv": [index_response[0]["hid"]],
+            }
+            keyset_response = self._get("datasets", keyset_payload).json()
+            assert [item["hid"] for item in keyset_response] == [2, 1]
+            assert keyset_response[0]["id"] == hdca_id
+            assert keyset_response[1]["id"] == hda_id
             index_payload_2 = {"limit": 2, "offset": 0, "q": ["history_content_type"], "qv": ["dataset"]}
             index_response = self._get("datasets", index_payload_2).json()
             assert index_response[1]["id"] == hda_id
@@ -125,33 +136,10 @@ class TestDatasetsApi(ApiTestCase):
             updated_hda = self._put(f"histories/{history_id}/contents/{hda_id}", update_payload, json=True).json()
             assert "cool:new_tag" in updated_hda["tags"]
             assert "cool:another_tag" in updated_hda["tags"]
-            payload = {
-                "limit": 10,
-                "offset": 0,
-                "q": ["history_content_type", "tag"],
-                "qv": ["dataset", "cool:new_tag"],
-                "history_id": history_id,
-            }
-            index_response = self._get("datasets", payload).json()
-            assert len(index_response) == 1
-            payload = {
-                "limit": 10,
-                "offset": 0,
-                "q": ["history_content_type", "tag-contains"],
-                "qv": ["dataset", "new_tag"],
-                "history_id": history_id,
-            }
-            index_response = self._get("datasets", payload).json()
-            assert len(index_response) == 1
-            payload = {
-                "limit": 10,
-                "offset": 0,
-                "q": ["history_content_type", "tag-contains"],
-                "qv": ["dataset", "notag"],
-                "history_id": history_id,
-            }
-            index_response = self._get("datasets", payload).json()
-            assert len(index_response) == 0
+            self._assert_dataset_search_counts(
+                history_id,
+                [("tag", "cool:new_tag", 1), ("tag-contains", "new_tag", 1), ("tag-contains", "notag", 0)],
+            )
 
     @requires_new_history
     def test_search_by_tag_case_insensitive(self):
@@ -163,62 +151,24 @@ class TestDatasetsApi(ApiTestCase):
             updated_hda = self._put(f"histories/{history_id}/contents/{hda_id}", update_payload, json=True).json()
             assert "name:new_TAG" in updated_hda["tags"]
             assert "cool:another_TAG" in updated_hda["tags"]
-            payload = {
-                "limit": 10,
-                "offset": 0,
-                "q": ["history_content_type", "tag"],
-                "qv": ["dataset", "name:new_tag"],
-                "history_id": history_id,
-            }
-            index_response = self._get("datasets", payload).json()
-            assert len(index_response) == 1
-            payload = {
-                "limit": 10,
-                "offset": 0,
-                "q": ["history_content_type", "tag-contains"],
-                "qv": ["dataset", "new_tag"],
-                "history_id": history_id,
-            }
-            index_response = self._get("datasets", payload).json()
-            assert len(index_response) == 1
-            payload = {
-                "limit": 10,
-                "offset": 0,
-                "q": ["history_content_type", "tag-contains"],
-                "qv": ["dataset", "notag"],
-                "history_id": history_id,
-            }
-            index_response = self._get("datasets", payload).json()
-            assert len(index_response) == 0
+            self._assert_dataset_search_counts(
+                history_id,
+                [("tag", "name:new_tag", 1), ("tag-contains", "new_tag", 1), ("tag-contains", "notag", 0)],
+            )
 
     @requires_new_history
     def test_search_by_tool_id(self):
         with self.dataset_populator.test_history_for(self.test_search_by_tool_id) as history_id:
             self.dataset_populator.new_dataset(history_id)
-            payload = {
-                "limit": 1,
-                "offset": 0,
-                "q": ["history_content_type", "tool_id"],
-                "qv": ["dataset", "__DATA_FETCH__"],
-                "history_id": history_id,
-            }
-            assert len(self._get("datasets", payload).json()) == 1
-            payload = {
-                "limit": 1,
-                "offset": 0,
-                "q": ["history_content_type", "tool_id"],
-                "qv": ["dataset", "__DATA_FETCH__X"],
-                "history_id": history_id,
-            }
-            assert len(self._get("datasets", payload).json()) == 0
-            payload = {
-                "limit": 1,
-                "offset": 0,
-                "q": ["history_content_type", "tool_id-contains"],
-                "qv": ["dataset", "ATA_FETCH"],
-                "history_id": history_id,
-            }
-            assert len(self._get("datasets", payload).json()) == 1
+            self._assert_dataset_search_counts(
+                history_id,
+                [
+                    ("tool_id", "__DATA_FETCH__", 1),
+                    ("tool_id", "__DATA_FETCH__X", 0),
+                    ("tool_id-contains", "ATA_FETCH", 1),
+                ],
+                limit=1,
+            )
             self.dataset_collection_populator.create_list_in_history(
                 history_id, name="search by tool id", contents=["1\n2\n3"], wait=True
             )
@@ -602,13 +552,16 @@ class TestDatasetsApi(ApiTestCase):
             history_id,
         )
         queued_id = run_response.json()["outputs"][0]["id"]
+        job_id = run_response.json()["jobs"][0]["id"]
 
         update_while_incomplete_response = self._put(  # try updating datatype while used as output of a running job
             f"histories/{history_id}/contents/{queued_id}", data={"datatype": "tabular"}, json=True
         )
         self._assert_status_code_is(update_while_incomplete_response, 400)
 
-        self.dataset_populator.wait_for_history_jobs(history_id)  # now wait for upload to complete
+        # no need to sit out the sleep, cancel the job and wait for it (and the upload) to finish
+        self._assert_status_code_is_ok(self.dataset_populator.cancel_job(job_id))
+        self.dataset_populator.wait_for_history_jobs(history_id)
 
         successful_updated_hda_response = self._put(
             f"histories/{history_id}/contents/{hda_id}", data={"datatype": "tabular"}, json=True
@@ -673,11 +626,9 @@ class TestDatasetsApi(ApiTestCase):
 
     def test_delete_batch(self):
         num_datasets = 4
-        dataset_map: Dict[int, str] = {}
         history_id = self.dataset_populator.new_history()
-        for index in range(num_datasets):
-            hda = self.dataset_populator.new_dataset(history_id)
-            dataset_map[index] = hda["id"]
+        hdas = self.dataset_populator.new_datasets(history_id, num_datasets)
+        dataset_map: Dict[int, str] = {index: hda["id"] for index, hda in enumerate(hdas)}
 
         self.dataset_populator.wait_for_history(history_id)
 
@@ -707,13 +658,11 @@ class TestDatasetsApi(ApiTestCase):
 
     def test_delete_batch_error(self):
         num_datasets = 4
-        dataset_map: Dict[int, str] = {}
 
         with self._different_user():
             history_id = self.dataset_populator.new_history()
-            for index in range(num_datasets):
-                hda = self.dataset_populator.new_dataset(history_id)
-                dataset_map[index] = hda["id"]
+            hdas = self.dataset_populator.new_datasets(history_id, num_datasets)
+            dataset_map: Dict[int, str] = {index: hda["id"] for index, hda in enumerate(hdas)}
 
             # Trying to delete datasets of wrong type will error
             expected_errored_source_ids = [
@@ -740,6 +689,29 @@ class TestDatasetsApi(ApiTestCase):
             self._assert_has_keys(error, "dataset", "error_message")
             self._assert_has_keys(error["dataset"], "id", "src")
 
+    def _assert_dataset_search_counts(
+        self, history_id: str, searches: List[Tuple[str, str, int]], limit: int = 10
+    ) -> None:
+        # run each (filter, value, expected count) dataset search concurrently
+        index_responses = self._get_many(
+            [
+                (
+                    "datasets",
+                    {
+                        "limit": limit,
+                        "offset": 0,
+                        "q": ["history_content_type", q],
+                        "qv": ["dataset", qv],
+                        "history_id": history_id,
+                    },
+                )
+                for q, qv, _ in searches
+            ]
+        )
+        for (q, qv, expected_count), index_response in zip(searches, index_responses):
+            self._assert_status_code_is(index_response, 200)
+            assert len(index_response.json()) == expected_count, f"{q}={qv}: {index_response.json()}"
+
     def _delete_batch_with_payload(self, payload):
         delete_response = self._delete("datasets", data=payload, json=True)
         self._assert_status_code_is_ok(delete_response)
@@ -749,10 +721,8 @@ class TestDatasetsApi(ApiTestCase):
     @skip_without_datatype("velvet")
     def test_composite_datatype_download(self, history_id):
         output = self.dataset_populator.fetch_hda(history_id, COMPOSITE_DATA_FETCH_REQUEST_1, wait=True)
-        response = self._get(f"histories/{history_id}/contents/{output['id']}/display?to_ext=zip")
-        self._assert_status_code_is(response, 200)
-        archive = zipfile.ZipFile(BytesIO(response.content))
-        namelist = archive.namelist()
+        with self._get_zip_archive(f"histories/{history_id}/contents/{output['id']}/display?to_ext=zip") as archive:
+            namelist = archive.namelist()
         assert len(namelist) == 4, f"Expected 3 elements in [{namelist}]"
 
     def test_compute_md5_on_primary_dataset(self, history_id):
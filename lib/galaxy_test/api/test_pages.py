@@ -8,7 +8,6 @@ from typing import (
 from unittest import SkipTest
 from uuid import uuid4
 
-from requests import delete
 from requests.models import Response
 
 from galaxy.exceptions import error_codes
@@ -333,17 +332,17 @@ steps:
 
     def test_delete(self):
         response_json = self._create_valid_page_with_slug("testdelete")
-        delete_response = delete(self._api_url(f"pages/{response_json['id']}", use_key=True))
+        delete_response = self._delete(f"pages/{response_json['id']}")
         self._assert_status_code_is(delete_response, 204)
 
     def test_400_on_delete_invalid_page_id(self):
-        delete_response = delete(self._api_url(f"pages/{self._random_key()}", use_key=True))
+        delete_response = self._delete(f"pages/{self._random_key()}")
         self._assert_status_code_is(delete_response, 400)
         self._assert_error_code_is(delete_response, error_codes.error_codes_by_name["MALFORMED_ID"])
 
     def test_403_on_delete_unowned_page(self):
         page_response = self._create_valid_page_as("others_page@bx.psu.edu", "otherspage")
-        delete_response = delete(self._api_url(f"pages/{page_response['id']}", use_key=True))
+        delete_response = self._delete(f"pages/{page_response['id']}")
         self._assert_status_code_is(delete_response, 403)
         self._assert_error_code_is(delete_response, error_codes.error_codes_by_name["USER_DOES_NOT_OWN_ITEM"])
 
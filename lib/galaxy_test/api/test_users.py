@@ -45,6 +45,18 @@ class TestUsersApi(ApiTestCase):
         all_deleted_users = all_deleted_users_response_2.json()
         assert len([u for u in all_deleted_users if u["email"] == TEST_USER_EMAIL_INDEX_DELETED]) == 1
 
+    @requires_admin
+    @requires_new_user
+    def test_index_admin_returns_full_user_entries(self):
+        self._setup_user(TEST_USER_EMAIL)
+        all_users_response = self._get("users", admin=True)
+        self._assert_status_code_is(all_users_response, 200)
+        all_users = all_users_response.json()
+        assert all_users
+        for user in all_users:
+            self._assert_has_keys(user, "id", "email", "username", "model_class")
+            assert user["model_class"] == "User"
+
     @requires_new_user
     def test_index_only_self_for_nonadmins(self):
         self._setup_user(TEST_USER_EMAIL)
@@ -61,6 +73,15 @@ class TestUsersApi(ApiTestCase):
             self._assert_status_code_is(show_response, 200)
             self.__assert_matches_user(user, show_response.json())
 
+    @requires_new_user
+    def test_show_other_user_as_non_admin(self):
+        with self._different_user():
+            other_user_id = self._get_current_user_id()
+        assert self._get_current_user_id() != other_user_id
+        show_response = self._get(f"users/{other_user_id}")
+        self._assert_status_code_is(show_response, 400)
+        assert show_response.json()["err_msg"] == "Invalid user id specified"
+
     @requires_new_user
     def test_update(self):
         payload = {"username": "linnaeus"}
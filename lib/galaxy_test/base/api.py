@@ -1,9 +1,16 @@
 import os
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
+    Iterator,
+    List,
     Optional,
+    Tuple,
 )
 from urllib.parse import (
     urlencode,
@@ -29,11 +36,15 @@ from .api_util import (
     OTHER_USER,
     TEST_USER,
 )
-from .interactor import TestCaseGalaxyInteractor as BaseInteractor
+from .interactor import (
+    get_shared_session,
+    TestCaseGalaxyInteractor as BaseInteractor,
+)
 
 CONFIG_PREFIXES = ["GALAXY_TEST_CONFIG_", "GALAXY_CONFIG_OVERRIDE_", "GALAXY_CONFIG_"]
 CELERY_BROKER = get_from_env("CELERY_BROKER", CONFIG_PREFIXES, "memory://")
 CELERY_BACKEND = get_from_env("CELERY_BACKEND", CONFIG_PREFIXES, "rpc://localhost")
+GALAXY_TEST_EXTERNAL = os.environ.get("GALAXY_TEST_EXTERNAL")
 
 DEFAULT_CELERY_CONFIG = {
     "broker_url": CELERY_BROKER,
@@ -61,7 +72,7 @@ class UsesCeleryTasks:
             self._celery_app = celery_session_app
             yield
         finally:
-            if os.environ.get("GALAXY_TEST_EXTERNAL") is None:
+            if GALAXY_TEST_EXTERNAL is None:
                 from galaxy.celery import celery_app
 
                 celery_app.fork_pool.stop()
@@ -91,34 +102,48 @@ class HasAnonymousGalaxyInteractor(Protocol):
         """Return an optionally anonymous galaxy interactor."""
 
 
+# API keys resolved for the default interactor of each (test class, Galaxy URL) pair
+_interactor_api_keys: Dict[Tuple[type, str], Optional[str]] = {}
+
+
+@lru_cache(maxsize=None)
+def api_base_url(url: str) -> str:
+    """Return the base URL of the API for the Galaxy instance served at ``url``."""
+    return urljoin(url, "api/")
+
+
 class UsesApiTestCaseMixin:
     url: str
     _galaxy_interactor: Optional["ApiTestInteractor"] = None
 
     def tearDown(self):
-        if os.environ.get("GALAXY_TEST_EXTERNAL") is None:
+        if GALAXY_TEST_EXTERNAL is None:
             # Only kill running jobs after test for managed test instances
             response = self.galaxy_interactor.get("jobs?state=running")
-            if response.ok:
-                for job in response.json():
-                    self._delete(f"jobs/{job['id']}")
+            if response.ok and (jobs := response.json()):
+                with ThreadPoolExecutor(max_workers=min(len(jobs), 8)) as executor:
+                    list(executor.map(lambda job: self._delete(f"jobs/{job['id']}"), jobs))
 
     def _api_url(self, path, params=None, use_key=None, use_admin_key=None):
-        if not params:
-            params = {}
-        url = urljoin(self.url, f"api/{path}")
-        if use_key:
-            params["key"] = self.galaxy_interactor.api_key
-        if use_admin_key:
-            params["key"] = self.galaxy_interactor.master_api_key
-        if query := urlencode(params):
-            url = f"{url}?{query}"
+        url = f"{api_base_url(self.url)}{path}"
+        if use_key or use_admin_key:
+            params = dict(params or {})
+            if use_key:
+                params["key"] = self.galaxy_interactor.api_key
+            if use_admin_key:
+                params["key"] = self.galaxy_interactor.master_api_key
+        if params:
+            url = f"{url}?{urlencode(params)}"
         return url
 
     def _setup_interactor(self):
         self.user_api_key = get_user_api_key()
         self.master_api_key = get_admin_api_key()
-        self._galaxy_interactor = self._get_interactor()
+        # Resolving the test user's key costs a user lookup and an API key request, do it once per
+        # test class and target server rather than for every test method.
+        cache_key = (type(self), self.url)
+        self._galaxy_interactor = self._get_interactor(api_key=_interactor_api_keys.get(cache_key))
+        _interactor_api_keys[cache_key] = self._galaxy_interactor.api_key
 
     @property
     def anonymous_galaxy_interactor(self) -> "ApiTestInteractor":
@@ -156,11 +181,10 @@ class UsesApiTestCaseMixin:
                 self._get("histories")  # Gets other_user@bx.psu.edu histories.
 
         """
-        original_api_key = self.user_api_key
-        original_interactor_key = self.galaxy_interactor.api_key
-        original_cookies = self.galaxy_interactor.cookies
+        original_state = (self.user_api_key, self.galaxy_interactor.api_key, self.galaxy_interactor.cookies)
         if anon:
-            cookies = requests.get(self.url).cookies
+            # API requests never create a Galaxy session, fetch a page to get an anonymous session cookie.
+            cookies = get_shared_session().get(self.url).cookies
             self.galaxy_interactor.cookies = cookies
             new_key = None
         else:
@@ -170,13 +194,34 @@ class UsesApiTestCaseMixin:
             self.galaxy_interactor.api_key = new_key
             yield
         finally:
-            self.user_api_key = original_api_key
-            self.galaxy_interactor.api_key = original_interactor_key
-            self.galaxy_interactor.cookies = original_cookies
+            self.user_api_key, self.galaxy_interactor.api_key, self.galaxy_interactor.cookies = original_state
 
     def _get(self, *args, **kwds):
         return self.galaxy_interactor.get(*args, **kwds)
 
+    def _get_many(self, gets: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[requests.Response]:
+        """Issue independent GET requests concurrently and return the responses in order.
+
+        Each entry of ``gets`` is a ``(path, params)`` tuple as accepted by ``_get``.
+        """
+        with ThreadPoolExecutor(max_workers=max(len(gets), 1)) as executor:
+            return list(executor.map(lambda get: self._get(*get), gets))
+
+    @contextmanager
+    def _get_zip_archive(self, *args, **kwds) -> Iterator[zipfile.ZipFile]:
+        """Stream a zip download to a spooled temporary file and yield it opened as a ``ZipFile``.
+
+        Arguments are passed through to ``_get``, the response must have status code 200.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as spool:
+            with self._get(*args, stream=True, **kwds) as response:
+                self._assert_status_code_is(response, 200)
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    spool.write(chunk)
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as archive:
+                yield archive
+
     def _head(self, *args, **kwds):
         return self.galaxy_interactor.head(*args, **kwds)
 
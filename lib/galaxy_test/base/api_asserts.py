@@ -52,8 +52,8 @@ def _report_status_code_error(
 
 def assert_has_keys(response: dict, *keys: str):
     """Assert that the supplied response (dict) has the supplied keys."""
-    for key in keys:
-        assert key in response, f"Response [{response}] does not contain key [{key}]"
+    missing_keys = set(keys).difference(response)
+    assert not missing_keys, f"Response [{response}] does not contain key(s) {sorted(missing_keys)}"
 
 
 def assert_not_has_keys(response: dict, *keys: str):
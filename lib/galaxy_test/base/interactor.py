@@ -1,4 +1,30 @@
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from galaxy.tool_util.verify.interactor import GalaxyInteractorApi
+from galaxy.util.user_agent import get_default_headers
+
+SHARED_SESSION_POOL_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+    """Return a requests session shared by all test case interactors.
+
+    Reusing a single session keeps connections to the Galaxy server under test
+    alive across requests and test cases. The session never stores cookies, test
+    cases that need cookies set them explicitly on their interactor.
+    """
+    session = requests.Session()
+    session.headers.update(get_default_headers())
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=SHARED_SESSION_POOL_SIZE, pool_maxsize=SHARED_SESSION_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class TestCaseGalaxyInteractor(GalaxyInteractorApi):
@@ -10,4 +36,5 @@ class TestCaseGalaxyInteractor(GalaxyInteractorApi):
             api_key=api_key or getattr(functional_test_case, "user_api_key", None),
             test_user=test_user,
             keep_outputs_dir=getattr(functional_test_case, "keepOutdir", None),
+            session=get_shared_session(),
         )
@@ -92,6 +92,8 @@ from galaxy.tool_util.cwl.util import (
 )
 from galaxy.tool_util.verify.test_data import TestDataResolver
 from galaxy.tool_util.verify.wait import (
+    DEFAULT_POLLING_BACKOFF,
+    DEFAULT_POLLING_DELTA,
     timeout_type,
     TimeoutAssertionError,
     wait_on as tool_util_wait_on,
@@ -127,6 +129,7 @@ workflow_str = resource_string(__package__, "data/test_workflow_1.ga")
 workflow_random_x2_str = resource_string(__package__, "data/test_workflow_2.ga")
 
 DEFAULT_TIMEOUT = 60  # Secs to wait for state to turn ok
+FETCHED_COLLECTION_POLLING_DELTA = 0.05  # Secs, initial delay and backoff while waiting on fetched collections
 
 SKIP_FLAKEY_TESTS_ON_ERROR = os.environ.get("GALAXY_TEST_SKIP_FLAKEY_TESTS_ON_ERROR", None)
 
@@ -490,6 +493,16 @@ class BaseDatasetPopulator(BasePopulator):
         outputs = fetch_response.json()["outputs"]
         return outputs
 
+    def new_datasets(
+        self, history_id: str, count: int, content: str = "TestData123", file_type: str = "txt", wait: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Create ``count`` history dataset instances (HDAs) with a single fetch request.
+
+        :returns: a list of dictionaries describing the new HDAs
+        """
+        items = [{"src": "pasted", "paste_content": content, "ext": file_type} for _ in range(count)]
+        return self.fetch_hdas(history_id, items, wait=wait)
+
     def fetch_hda(self, history_id: str, item: Dict[str, Any], wait: bool = True) -> Dict[str, Any]:
         hdas = self.fetch_hdas(history_id, [item], wait=wait)
         assert len(hdas) == 1
@@ -620,8 +633,12 @@ class BaseDatasetPopulator(BasePopulator):
         self, history_id: str, assert_ok: bool = False, timeout: timeout_type = DEFAULT_TIMEOUT
     ) -> str:
         try:
+            # only serialize the state on each poll, not the full history
             return wait_on_state(
-                lambda: self._get(f"histories/{history_id}"), desc="history state", assert_ok=assert_ok, timeout=timeout
+                lambda: self._get(f"histories/{history_id}", {"keys": "state"}),
+                desc="history state",
+                assert_ok=assert_ok,
+                timeout=timeout,
             )
         except AssertionError:
             self._summarize_history(history_id)
@@ -661,7 +678,13 @@ class BaseDatasetPopulator(BasePopulator):
             self.wait_for_job(job_id, assert_ok=assert_ok, timeout=timeout, ok_states=ok_states)
 
     def wait_for_job(
-        self, job_id: str, assert_ok: bool = False, timeout: timeout_type = DEFAULT_TIMEOUT, ok_states=None
+        self,
+        job_id: str,
+        assert_ok: bool = False,
+        timeout: timeout_type = DEFAULT_TIMEOUT,
+        ok_states=None,
+        delta: timeout_type = DEFAULT_POLLING_DELTA,
+        polling_backoff: timeout_type = DEFAULT_POLLING_BACKOFF,
     ):
         return wait_on_state(
             lambda: self.get_job_details(job_id, full=True),
@@ -669,6 +692,8 @@ class BaseDatasetPopulator(BasePopulator):
             assert_ok=assert_ok,
             timeout=timeout,
             ok_states=ok_states,
+            delta=delta,
+            polling_backoff=polling_backoff,
         )
 
     def get_job_details(self, job_id: str, full: bool = False) -> Response:
@@ -2954,7 +2979,14 @@ class BaseDatasetCollectionPopulator:
             fetch_response_dict = fetch_response.json()
         else:
             fetch_response_dict = fetch_response
-        self.dataset_populator.wait_for_job(fetch_response_dict["jobs"][0]["id"], assert_ok=True)
+        # Fetch jobs for small test collections usually finish quickly, so
+        # start polling fast and back off rather than sleeping a full delta.
+        self.dataset_populator.wait_for_job(
+            fetch_response_dict["jobs"][0]["id"],
+            assert_ok=True,
+            delta=FETCHED_COLLECTION_POLLING_DELTA,
+            polling_backoff=FETCHED_COLLECTION_POLLING_DELTA,
+        )
         initial_dataset_collection = fetch_response_dict["output_collections"][0]
         dataset_collection = self.dataset_populator.get_history_collection_details(
             initial_dataset_collection["history_id"], hid=initial_dataset_collection["hid"]
@@ -3198,6 +3230,8 @@ def wait_on_state(
     ok_states=None,
     assert_ok: bool = False,
     timeout: timeout_type = DEFAULT_TIMEOUT,
+    delta: timeout_type = DEFAULT_POLLING_DELTA,
+    polling_backoff: timeout_type = DEFAULT_POLLING_BACKOFF,
 ) -> str:
     def get_state():
         response = state_func()
@@ -3229,7 +3263,7 @@ def wait_on_state(
     # Remove ok_states from skip_states, so we can wait for a state to becoming running
     skip_states = [s for s in skip_states if s not in ok_states]
     try:
-        return wait_on(get_state, desc=desc, timeout=timeout)
+        return wait_on(get_state, desc=desc, timeout=timeout, delta=delta, polling_backoff=polling_backoff)
     except TimeoutAssertionError as e:
         response = state_func()
         raise TimeoutAssertionError(f"{e} Current response containing state [{response.json()}].")
@@ -3332,8 +3366,14 @@ class GiWorkflowPopulator(GiHttpMixin, BaseWorkflowPopulator):
         self.dataset_populator = GiDatasetPopulator(gi)
 
 
-def wait_on(function: Callable, desc: str, timeout: timeout_type = DEFAULT_TIMEOUT):
-    return tool_util_wait_on(function, desc, timeout)
+def wait_on(
+    function: Callable,
+    desc: str,
+    timeout: timeout_type = DEFAULT_TIMEOUT,
+    delta: timeout_type = DEFAULT_POLLING_DELTA,
+    polling_backoff: timeout_type = DEFAULT_POLLING_BACKOFF,
+):
+    return tool_util_wait_on(function, desc, timeout, delta=delta, polling_backoff=polling_backoff)
 
 
 def wait_on_assertion(function: Callable, desc: str, timeout: timeout_type = DEFAULT_TIMEOUT):
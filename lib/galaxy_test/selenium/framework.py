@@ -1,12 +1,17 @@
 """Basis for Selenium test framework."""
 
-import datetime
 import errno
+import itertools
 import json
+import logging
 import os
+import time
 import traceback
 import unittest
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
 from functools import (
+    lru_cache,
     partial,
     wraps,
 )
@@ -18,7 +23,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-import requests
 import yaml
 from gxformat2 import (
     convert_and_import_workflow,
@@ -43,6 +47,7 @@ from galaxy.util import (
 from galaxy.util.unittest_utils import skip_if_github_down
 from galaxy_test.base import populators
 from galaxy_test.base.api import (
+    api_base_url,
     UsesApiTestCaseMixin,
     UsesCeleryTasks,
 )
@@ -55,6 +60,7 @@ from galaxy_test.base.env import (
     DEFAULT_WEB_HOST,
     get_ip_address,
 )
+from galaxy_test.base.interactor import get_shared_session
 from galaxy_test.base.populators import (
     load_data_dict,
     YamlContentT,
@@ -66,6 +72,8 @@ try:
 except ImportError:
     GalaxyTestDriver = None  # type: ignore[misc,assignment]
 
+log = logging.getLogger(__name__)
+
 DEFAULT_TIMEOUT_MULTIPLIER = 1
 DEFAULT_TEST_ERRORS_DIRECTORY = os.path.abspath("database/test_errors")
 DEFAULT_SELENIUM_HEADLESS = "auto"
@@ -108,6 +116,15 @@ window.localStorage && window.localStorage.setItem("galaxy:debug", true);
 window.localStorage && window.localStorage.setItem("galaxy:debug:flatten", true);
 """
 
+_unique_suffix_counter = itertools.count()
+# Next copy number to try for each (label, extension) passed to _screenshot_path
+_screenshot_copies: Dict[Tuple[str, str], int] = {}
+
+
+def _unique_suffix() -> str:
+    # The timestamp alone is only second precision, the counter keeps names from the same second distinct.
+    return f"{int(time.time())}-{next(_unique_suffix_counter)}"
+
 
 def managed_history(f):
     """Ensure a Selenium test has a distinct, named history.
@@ -120,7 +137,7 @@ def managed_history(f):
     @wraps(f)
     def func_wrapper(self, *args, **kwds):
         self.home()
-        history_name = f.__name__ + datetime.datetime.now().strftime("%Y%m%d%H%M%s")
+        history_name = f.__name__ + _unique_suffix()
         self.history_panel_create_new_with_name(history_name)
         try:
             f(self, *args, **kwds)
@@ -131,7 +148,7 @@ def managed_history(f):
                     self.dataset_populator.cancel_history_jobs(current_history_id)
                     self.api_delete(f"histories/{current_history_id}")
                 except Exception:
-                    print("Faild to cleanup managed history, selenium connection corrupted somehow?")
+                    log.warning("Failed to cleanup managed history, selenium connection corrupted somehow?")
 
     return func_wrapper
 
@@ -140,25 +157,35 @@ def dump_test_information(self, name_prefix):
     if GALAXY_TEST_ERRORS_DIRECTORY and GALAXY_TEST_ERRORS_DIRECTORY != "0":
         if not os.path.exists(GALAXY_TEST_ERRORS_DIRECTORY):
             os.makedirs(GALAXY_TEST_ERRORS_DIRECTORY)
-        result_name = name_prefix + datetime.datetime.now().strftime("%Y%m%d%H%M%s")
+        result_name = name_prefix + _unique_suffix()
         target_directory = os.path.join(GALAXY_TEST_ERRORS_DIRECTORY, result_name)
 
         def write_file(name, content, raw=False):
-            with open(os.path.join(target_directory, name), "wb") as buf:
-                buf.write(content.encode("utf-8") if not raw else content)
+            path = os.path.join(target_directory, name)
+            if raw:
+                with open(path, "wb") as buf:
+                    buf.write(content)
+            else:
+                with open(path, "w", encoding="utf-8") as fh:
+                    fh.write(content)
+
+        def write_json_file(name, content, **dump_kwds):
+            with open(os.path.join(target_directory, name), "w", encoding="utf-8") as fh:
+                json.dump(content, fh, **dump_kwds)
 
         os.makedirs(target_directory)
         write_file("stacktrace.txt", traceback.format_exc())
-        for snapshot in getattr(self, "snapshots", []):
-            snapshot.write_to_error_directory(write_file)
+        # Snapshots are already captured, writing them out is just disk I/O so overlap it.
+        snapshots = getattr(self, "snapshots", [])
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda snapshot: snapshot.write_to_error_directory(write_file), snapshots))
 
         # Try to use the Selenium driver to write a final summary of the accessibility
         # information for the test.
         try:
             self.axe_eval(write_to=os.path.join(target_directory, "last.a11y.json"))
         except Exception as e:
-            print(e)
-            print("Failed to use test driver to print accessibility information")
+            log.warning("Failed to use test driver to print accessibility information: %s", e)
 
         # Try to use the Selenium driver to recover more debug information, but don't
         # throw an exception if the connection is broken in some way.
@@ -168,15 +195,16 @@ def dump_test_information(self, name_prefix):
             write_file("DOM.txt", self.driver.execute_script("return document.documentElement.outerHTML"))
         except Exception:
             formatted_exception = traceback.format_exc()
-            print(f"Failed to use test driver to recover debug information from Selenium: {formatted_exception}")
+            log.warning("Failed to use test driver to recover debug information from Selenium: %s", formatted_exception)
             write_file("selenium_exception.txt", formatted_exception)
 
         for log_type in ["browser", "driver"]:
             try:
                 full_log = self.driver.get_log(log_type)
                 trimmed_log = [entry for entry in full_log if entry["level"] not in ["DEBUG", "INFO"]]
-                write_file(f"{log_type}.log.json", json.dumps(trimmed_log, indent=True))
-                write_file(f"{log_type}.log.verbose.json", json.dumps(full_log, indent=True))
+                write_json_file(f"{log_type}.log.json", trimmed_log, indent=True)
+                # The verbose log can be large and is rarely read, write it compactly.
+                write_json_file(f"{log_type}.log.verbose.json", full_log, separators=(",", ":"))
             except Exception:
                 continue
 
@@ -234,7 +262,9 @@ class TestSnapshot:
     __test__ = False  # Prevent pytest from discovering this class (issue #12071)
 
     def __init__(self, driver, index, description):
-        self.screenshot_binary = driver.get_screenshot_as_png()
+        # The browser has to render the screenshot now, but most snapshots are never written out -
+        # keep WebDriver's base64 payload and only decode it on the failure path.
+        self.screenshot_base64 = driver.get_screenshot_as_base64()
         self.description = description
         self.index = index
         self.exc = traceback.format_exc()
@@ -242,7 +272,7 @@ class TestSnapshot:
 
     def write_to_error_directory(self, write_file_func):
         prefix = "%d-%s" % (self.index, self.description)
-        write_file_func(f"{prefix}-screenshot.png", self.screenshot_binary, raw=True)
+        write_file_func(f"{prefix}-screenshot.png", b64decode(self.screenshot_base64), raw=True)
         write_file_func(f"{prefix}-traceback.txt", self.exc)
         write_file_func(f"{prefix}-stack.txt", str(self.stack))
 
@@ -367,12 +397,17 @@ class TestWithSeleniumMixin(GalaxyTestSeleniumContext, UsesApiTestCaseMixin, Use
             return
         if not os.path.exists(GALAXY_TEST_SCREENSHOTS_DIRECTORY):
             os.makedirs(GALAXY_TEST_SCREENSHOTS_DIRECTORY)
-        target = os.path.join(GALAXY_TEST_SCREENSHOTS_DIRECTORY, label + extension)
-        copy = 1
-        while os.path.exists(target):
+        # Start from the first copy number not yet handed out in this process rather than re-probing
+        # every earlier copy of the label.
+        copy = _screenshot_copies.get((label, extension), 0)
+        while True:
+            name = label + extension if copy == 0 else "%s-%d%s" % (label, copy, extension)
+            target = os.path.join(GALAXY_TEST_SCREENSHOTS_DIRECTORY, name)
+            if not os.path.exists(target):
+                break
             # Maybe previously a test re-run - keep the original.
-            target = os.path.join(GALAXY_TEST_SCREENSHOTS_DIRECTORY, "%s-%d%s" % (label, copy, extension))
             copy += 1
+        _screenshot_copies[(label, extension)] = copy + 1
 
         return target
 
@@ -406,22 +441,7 @@ class TestWithSeleniumMixin(GalaxyTestSeleniumContext, UsesApiTestCaseMixin, Use
             self.register()
 
     def tear_down_driver(self):
-        exception = None
-        try:
-            self.driver.close()
-        except Exception as e:
-            if "cannot kill Chrome" in str(e):
-                print(f"Ignoring likely harmless error in Selenium shutdown {e}")
-            else:
-                exception = e
-
-        try:
-            self.display.stop()
-        except Exception as e:
-            exception = e
-
-        if exception is not None:
-            raise exception
+        close_driver_and_display(self.driver, self.display)
 
     @classproperty
     def default_web_host(cls):
@@ -511,6 +531,51 @@ class SharedStateSeleniumTestCase(SeleniumTestCase):
 
     shared_state_initialized = False
     shared_state_in_error = False
+    # Browser and virtual display reused by all tests of the class, closed in tearDownClass.
+    shared_driver: Optional[Tuple[Any, driver_factory.ConfiguredDriver]] = None
+
+    def setup_driver_and_session(self):
+        shared_driver = self.__class__.shared_driver
+        if shared_driver is not None:
+            self.display, self.configured_driver = shared_driver
+            try:
+                self._reset_browser_state()
+                self._setup_galaxy_logging()
+                return
+            except Exception:
+                log.warning("Failed to reset shared Selenium browser, starting a new one.", exc_info=True)
+                self.__class__._close_shared_driver()
+        super().setup_driver_and_session()
+        self.__class__.shared_driver = (self.display, self.configured_driver)
+
+    def _reset_browser_state(self):
+        # Start each test like a freshly launched browser - anonymous and without stored client state.
+        self.home()
+        self.driver.delete_all_cookies()
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    def tear_down_driver(self):
+        """Keep the browser open for the next test of this class."""
+
+    def reset_driver_and_session(self):
+        # Test retries should start over with a new browser.
+        self.__class__._close_shared_driver()
+        super().reset_driver_and_session()
+
+    @classmethod
+    def _close_shared_driver(cls):
+        shared_driver = cls.shared_driver
+        cls.shared_driver = None
+        if shared_driver is not None:
+            display, configured_driver = shared_driver
+            close_driver_and_display(configured_driver.driver, display)
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            cls._close_shared_driver()
+        finally:
+            super().tearDownClass()
 
     def setup_with_driver(self):
         if not self.__class__.shared_state_initialized:
@@ -671,6 +736,26 @@ class RunsWorkflows(GalaxyTestSeleniumContext):
             item.title.wait_for_and_click()
 
 
+def close_driver_and_display(driver, display):
+    exception = None
+    try:
+        driver.close()
+    except Exception as e:
+        if "cannot kill Chrome" in str(e):
+            log.debug("Ignoring likely harmless error in Selenium shutdown: %s", e)
+        else:
+            exception = e
+
+    try:
+        display.stop()
+    except Exception as e:
+        exception = e
+
+    if exception is not None:
+        raise exception
+
+
+@lru_cache(maxsize=1)
 def default_web_host_for_selenium_tests():
     if asbool(GALAXY_TEST_SELENIUM_REMOTE):
         try:
@@ -692,6 +777,7 @@ def get_configured_driver():
     )
 
 
+@lru_cache(maxsize=1)
 def headless_selenium():
     if asbool(GALAXY_TEST_SELENIUM_REMOTE):
         return False
@@ -708,6 +794,7 @@ def headless_selenium():
         return asbool(GALAXY_TEST_SELENIUM_HEADLESS)
 
 
+@lru_cache(maxsize=1)
 def use_virtual_display():
     if asbool(GALAXY_TEST_SELENIUM_REMOTE):
         return False
@@ -733,48 +820,54 @@ class SeleniumSessionGetPostMixin:
     def _mixin_admin_api_key(self) -> str:
         return getattr(self, "admin_api_key", get_admin_api_key())
 
+    def _api_url_for(self, route: str) -> str:
+        # Same as build_url(f"api/{route}", for_selenium=False) but only resolves the API root once per Galaxy URL.
+        return f"{api_base_url(self.selenium_context.url)}{route}"
+
     def _get(self, route, data=None, headers=None, admin=False) -> Response:
         data = data or {}
-        full_url = self.selenium_context.build_url(f"api/{route}", for_selenium=False)
+        full_url = self._api_url_for(route)
         cookies = None
         if admin:
             full_url = f"{full_url}?key={self._mixin_admin_api_key}"
         else:
             cookies = self.selenium_context.selenium_to_requests_cookies()
-        response = requests.get(full_url, params=data, cookies=cookies, headers=headers, timeout=DEFAULT_SOCKET_TIMEOUT)
+        response = get_shared_session().get(
+            full_url, params=data, cookies=cookies, headers=headers, timeout=DEFAULT_SOCKET_TIMEOUT
+        )
         return response
 
     def _post(self, route, data=None, files=None, headers=None, admin=False, json: bool = False) -> Response:
-        full_url = self.selenium_context.build_url(f"api/{route}", for_selenium=False)
+        full_url = self._api_url_for(route)
         cookies = None
         if admin:
             full_url = f"{full_url}?key={self._mixin_admin_api_key}"
         else:
             cookies = self.selenium_context.selenium_to_requests_cookies()
         request_kwd = prepare_request_params(data=data, files=files, as_json=json, headers=headers, cookies=cookies)
-        response = requests.post(full_url, timeout=DEFAULT_SOCKET_TIMEOUT, **request_kwd)
+        response = get_shared_session().post(full_url, timeout=DEFAULT_SOCKET_TIMEOUT, **request_kwd)
         return response
 
     def _delete(self, route, data=None, headers=None, admin=False, json: bool = False) -> Response:
-        full_url = self.selenium_context.build_url(f"api/{route}", for_selenium=False)
+        full_url = self._api_url_for(route)
         cookies = None
         if admin:
             full_url = f"{full_url}?key={self._mixin_admin_api_key}"
         else:
             cookies = self.selenium_context.selenium_to_requests_cookies()
         request_kwd = prepare_request_params(data=data, as_json=json, headers=headers, cookies=cookies)
-        response = requests.delete(full_url, timeout=DEFAULT_SOCKET_TIMEOUT, **request_kwd)
+        response = get_shared_session().delete(full_url, timeout=DEFAULT_SOCKET_TIMEOUT, **request_kwd)
         return response
 
     def _put(self, route, data=None, headers=None, admin=False, json: bool = False) -> Response:
-        full_url = self.selenium_context.build_url(f"api/{route}", for_selenium=False)
+        full_url = self._api_url_for(route)
         cookies = None
         if admin:
             full_url = f"{full_url}?key={self._mixin_admin_api_key}"
         else:
             cookies = self.selenium_context.selenium_to_requests_cookies()
         request_kwd = prepare_request_params(data=data, as_json=json, headers=headers, cookies=cookies)
-        response = requests.put(full_url, **request_kwd)
+        response = get_shared_session().put(full_url, **request_kwd)
         return response
 
 
@@ -814,12 +907,11 @@ class SeleniumSessionWorkflowPopulator(
         self.dataset_collection_populator = SeleniumSessionDatasetCollectionPopulator(selenium_context)
 
     def import_workflow(self, workflow: dict, **kwds) -> dict:
-        workflow_str = json.dumps(workflow, indent=4)
         data = {
-            "workflow": workflow_str,
+            "workflow": workflow,
         }
         data.update(**kwds)
-        upload_response = self._post("workflows", data=data)
+        upload_response = self._post("workflows", data=data, json=True)
         upload_response.raise_for_status()
         return upload_response.json()
 